@@ -11,7 +11,7 @@ from typing import List
 import pandas as pd
 import streamlit as st
 
-from src.comparator import filter_new_leads
+from src.comparator import dedupe_leads, filter_new_leads
 from src.scraper.google_maps import search_google_maps
 from src.scraper.snappfood import search_snappfood
 from src.scraper.phone_extractor import fetch_phone_from_page
@@ -78,16 +78,7 @@ def run_search(categories: List[str], location: str, headless: bool = True, max_
             st.warning(f"SnappFood scraper error for {cat}: {e}")
 
     # dedupe by normalized name+address
-    seen = set()
-    aggregated = []
-    for r in results:
-        key = (r.get('name', '').strip().lower(), r.get('address', '').strip().lower())
-        if not key[0]:
-            continue
-        if key in seen:
-            continue
-        seen.add(key)
-        aggregated.append(r)
+    aggregated = dedupe_leads(results)
 
     # attempt to fetch phone numbers for candidates that have links — parallel
     to_fetch = []
@@ -0,0 +1,242 @@
+"""Benchmark the comparator and replayed scrape pipeline on synthetic leads.
+
+For each size, writes an existing CSV of that many rows plus a scraped-leads
+CSV (see `src/synthetic.py`), then times CSV load, `normalize`, in-run
+dedupe, `filter_new_leads` and the `run_scrape.py --replay` pipeline. Reports
+throughput, peak traced memory and duplicate-match precision/recall, and
+compares them against a saved baseline to flag regressions.
+
+`filter_new_leads` scans the whole existing CSV per lead, so the matching
+stages run `--match-sample` freshly generated leads against the first
+`--match-existing` existing rows rather than the full dataset; their numbers
+do not grow with `--sizes`.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from src.comparator import dedupe_leads, filter_new_leads, load_existing, normalize
+from src.synthetic import synthetic_scrape, write_datasets
+from run_scrape import load_replay, process_leads
+
+
+# arguments that change the workload; a baseline only applies to the same ones
+WORKLOAD_ARGS = ('new_ratio', 'dup_rate', 'repeat_rate', 'match_existing', 'match_sample', 'threshold', 'seed')
+
+
+def _autorange(fn, min_time: float = 0.2):
+    """Call `fn` until at least `min_time` has passed, as timeit's autorange does."""
+    number = 0
+    t0 = time.perf_counter()
+    while True:
+        result = fn()
+        number += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return result, elapsed / number
+
+
+def _measure(fn, memory: bool = True, repeat: int = 1):
+    elapsed = float('inf')
+    for _ in range(max(1, repeat)):
+        result, per_call = _autorange(fn)
+        # best of `repeat` runs, as timeit does, to damp scheduler noise
+        elapsed = min(elapsed, per_call)
+    peak_mb = None
+    if memory:
+        # separate pass: tracing slows allocation-heavy code down a lot
+        tracemalloc.start()
+        try:
+            fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+    return result, elapsed, peak_mb
+
+
+def _stats(rows: int, elapsed: float, peak_mb) -> dict:
+    return {
+        "rows": rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_s": round(rows / elapsed, 1) if elapsed else None,
+        "peak_mb": round(peak_mb, 2) if peak_mb is not None else None,
+    }
+
+
+def _precision_recall(predicted: set, actual: set) -> dict:
+    tp = len(predicted & actual)
+    return {
+        "precision": round(tp / len(predicted), 4) if predicted else 1.0,
+        "recall": round(tp / len(actual), 4) if actual else 1.0,
+    }
+
+
+def bench_size(size: int, args, workdir: str) -> dict:
+    existing_path = os.path.join(workdir, f'existing_{size}.csv')
+    new_path = os.path.join(workdir, f'new_{size}.csv')
+    new_count = max(1, int(size * args.new_ratio))
+    results = {}
+
+    t0 = time.perf_counter()
+    write_datasets(existing_path, new_path, size, new_count, args.dup_rate, args.repeat_rate, seed=args.seed)
+    elapsed = time.perf_counter() - t0
+    results['generate'] = _stats(size + new_count, elapsed, None)
+
+    existing, elapsed, peak = _measure(lambda: load_existing(existing_path), args.memory, args.repeat)
+    results['csv_load'] = _stats(len(existing), elapsed, peak)
+
+    def normalize_all():
+        for name, address in zip(existing['name'], existing['address']):
+            normalize(name)
+            normalize(address)
+
+    _, elapsed, peak = _measure(normalize_all, args.memory, args.repeat)
+    results['normalize'] = _stats(len(existing), elapsed, peak)
+
+    leads = pd.read_csv(new_path, dtype=str, keep_default_na=False).to_dict('records')
+    kept, elapsed, peak = _measure(lambda: dedupe_leads(leads), args.memory, args.repeat)
+    kept_ids = {id(r) for r in kept}
+    results['inrun_dedupe'] = _stats(len(leads), elapsed, peak)
+    results['inrun_dedupe'].update(_precision_recall(
+        {i for i, r in enumerate(leads) if id(r) not in kept_ids},
+        {i for i, r in enumerate(leads) if r['run_repeat']},
+    ))
+
+    subset_rows = min(args.match_existing, len(existing))
+    subset_path = os.path.join(workdir, f'existing_{size}_subset.csv')
+    existing.head(subset_rows).to_csv(subset_path, index=False)
+    del existing, leads, kept
+    # drawn against the subset itself so the sample hits its size and dup rate
+    sample = list(synthetic_scrape(args.match_sample, subset_rows, args.dup_rate, args.repeat_rate, seed=args.seed))
+    for i, r in enumerate(sample):
+        r['_row'] = str(i)
+    rows = {r['_row'] for r in sample}
+    actual = {r['_row'] for r in sample if r['duplicate_of']}
+
+    # the matching stages take seconds per call, so autorange runs them once
+    new_df, elapsed, peak = _measure(lambda: filter_new_leads(sample, subset_path, args.threshold), args.memory)
+    results['filter_new_leads'] = _stats(len(sample), elapsed, peak)
+    results['filter_new_leads'].update(_precision_recall(rows - set(new_df.get('_row', [])), actual))
+
+    replay_path = os.path.join(workdir, f'replay_{size}.csv')
+    out_path = os.path.join(workdir, f'out_{size}.csv')
+    pd.DataFrame(sample).to_csv(replay_path, index=False)
+
+    def replay():
+        out = process_leads(load_replay(replay_path), subset_path, args.threshold)
+        out.to_csv(out_path, index=False)
+        return out
+
+    new_df, elapsed, peak = _measure(replay, args.memory)
+    results['replay_pipeline'] = _stats(len(sample), elapsed, peak)
+    # the pipeline also drops in-run repeats, which count as duplicates here
+    actual |= {r['_row'] for r in sample if r['run_repeat']}
+    results['replay_pipeline'].update(_precision_recall(rows - set(new_df.get('_row', [])), actual))
+    return results
+
+
+def find_regressions(current: dict, baseline: dict, tolerance: float, accuracy_tolerance: float) -> list:
+    problems = []
+    for size, stages in current.items():
+        for stage, stats in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            if stats['rows'] != base.get('rows'):
+                problems.append(f"{size} {stage} rows: {stats['rows']} (baseline {base.get('rows')}), not compared")
+                continue
+            for metric, value in stats.items():
+                ref = base.get(metric)
+                if value is None or ref is None:
+                    continue
+                if metric in ("precision", "recall"):
+                    bad = value < ref - accuracy_tolerance
+                elif metric == "rows_per_s":
+                    bad = value < ref * (1 - tolerance)
+                elif metric == "peak_mb":
+                    # absolute floor so near-zero baselines are not tripped by noise
+                    bad = value > max(ref * (1 + tolerance), ref + 1.0)
+                else:
+                    continue
+                if bad:
+                    problems.append(f"{size} {stage} {metric}: {value} (baseline {ref})")
+    return problems
+
+
+def print_report(size: str, stages: dict, args):
+    print(f"\n== {size} existing rows ==")
+    print(f"(matching stages: {args.match_sample} leads vs the first {args.match_existing} existing rows at every size)")
+    print(f"{'stage':<18}{'rows':>10}{'seconds':>10}{'rows/s':>14}{'peak MB':>10}{'prec':>8}{'recall':>8}")
+    for stage, s in stages.items():
+        peak = f"{s['peak_mb']:.1f}" if s['peak_mb'] is not None else '-'
+        prec = f"{s['precision']:.3f}" if 'precision' in s else '-'
+        rec = f"{s['recall']:.3f}" if 'recall' in s else '-'
+        print(f"{stage:<18}{s['rows']:>10}{s['seconds']:>10.3f}{s['rows_per_s'] or 0:>14,.0f}{peak:>10}{prec:>8}{rec:>8}")
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--sizes', nargs='+', type=int, default=[10000], help='Existing dataset sizes, e.g. 10000 1000000 10000000')
+    p.add_argument('--new-ratio', type=float, default=0.1, help='Scraped leads per existing row')
+    p.add_argument('--dup-rate', type=float, default=0.2, help='Share of scraped leads that re-find an existing row')
+    p.add_argument('--repeat-rate', type=float, default=0.05, help='Share of scraped leads repeated within the run')
+    p.add_argument('--match-existing', type=int, default=1000, help='Existing rows used by the matching stages')
+    p.add_argument('--match-sample', type=int, default=200, help='Leads sent through the matching stages')
+    p.add_argument('--threshold', type=int, default=85, help='Duplicate match threshold')
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--repeat', type=int, default=3, help='Timed runs per fast stage; the fastest is reported')
+    p.add_argument('--no-memory', dest='memory', action='store_false', help='Skip the traced peak-memory pass')
+    p.add_argument('--baseline', help='Compare against this baseline JSON and exit 1 on regressions (2 if its workload differs)')
+    p.add_argument('--save-baseline', help='Write results to this baseline JSON')
+    p.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative throughput/memory regression')
+    p.add_argument('--accuracy-tolerance', type=float, default=0.02, help='Allowed absolute precision/recall drop')
+    args = p.parse_args()
+
+    params = {k: getattr(args, k) for k in WORKLOAD_ARGS}
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        saved = baseline['meta'].get('params', {})
+        differ = [f"{k}={params[k]} (baseline {saved.get(k)})" for k in WORKLOAD_ARGS if saved.get(k) != params[k]]
+        if differ:
+            print(f"Refusing to compare against {args.baseline}: workload differs: {', '.join(differ)}")
+            sys.exit(2)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            results[str(size)] = bench_size(size, args, workdir)
+            print_report(str(size), results[str(size)], args)
+
+    if args.save_baseline:
+        meta = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "pandas": pd.__version__,
+            "params": params,
+        }
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+            f.write('\n')
+        print(f"\nSaved baseline to {args.save_baseline}")
+
+    if baseline is not None:
+        problems = find_regressions(results, baseline['results'], args.tolerance, args.accuracy_tolerance)
+        if problems:
+            print('\nRegressions against baseline:')
+            for line in problems:
+                print(f'  {line}')
+            sys.exit(1)
+        print('\nNo regressions against baseline.')
+
+
+if __name__ == '__main__':
+    main()
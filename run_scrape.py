@@ -1,28 +1,37 @@
-"""CLI runner to run scrapers and save new leads compared to existing CSV."""
+"""CLI runner to run scrapers and save new leads compared to existing CSV.
+
+Scraped candidates can be saved with `--record` and fed back through the
+same dedupe/filter pipeline later with `--replay`, without opening a browser.
+"""
 import argparse
 import sys
 import pandas as pd
 
-from src.scraper.google_maps import search_google_maps
-from src.scraper.snappfood import search_snappfood
-from src.comparator import filter_new_leads
+from src.comparator import dedupe_leads, filter_new_leads
 
 
 def aggregate_search(categories, location, headless=True):
+    # imported here so --replay works without Playwright installed
+    from src.scraper.google_maps import search_google_maps
+    from src.scraper.snappfood import search_snappfood
+
     results = []
     for cat in categories:
         results += search_google_maps(cat, location, headless=headless, max_results=50)
         results += search_snappfood(cat, location, headless=headless, max_results=50)
-    # dedupe
-    seen = set()
-    out = []
-    for r in results:
-        key = (r.get('name', '').lower(), r.get('address', '').lower())
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(r)
-    return out
+    return results
+
+
+def load_replay(path: str) -> list:
+    try:
+        return pd.read_csv(path, dtype=str, keep_default_na=False).to_dict('records')
+    except pd.errors.EmptyDataError:
+        # a recorded run that found nothing
+        return []
+
+
+def process_leads(leads: list, existing_path: str, threshold: int = 85) -> pd.DataFrame:
+    return filter_new_leads(dedupe_leads(leads), existing_path, threshold=threshold)
 
 
 def main():
@@ -32,14 +41,22 @@ def main():
     p.add_argument('--location', default='', help='Location hint for searches')
     p.add_argument('--headless', action='store_true', help='Run browsers in headless mode')
     p.add_argument('--categories', nargs='+', default=['Cafes', 'Restaurants', 'Ice Cream Shops'])
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument('--record', help='Save raw scraped candidates to this CSV for later replay')
+    mode.add_argument('--replay', help='Skip scraping and process candidates from a recorded CSV')
     args = p.parse_args()
 
-    leads = aggregate_search(args.categories, args.location, headless=args.headless)
+    if args.replay:
+        leads = load_replay(args.replay)
+    else:
+        leads = aggregate_search(args.categories, args.location, headless=args.headless)
+        if args.record:
+            pd.DataFrame(leads).to_csv(args.record, index=False)
     if not leads:
         print('No leads found by scrapers.')
         sys.exit(0)
 
-    new_df = filter_new_leads(leads, args.existing)
+    new_df = process_leads(leads, args.existing)
     if new_df.empty:
         print('No new leads — nothing to save.')
     else:
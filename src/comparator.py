@@ -2,7 +2,9 @@
 
 Uses RapidFuzz token-sort ratio to avoid duplicates even with small name/address
 variations. Exposes `filter_new_leads(leads, existing_path)` which returns a
-DataFrame of leads not present in the existing CSV.
+DataFrame of leads not present in the existing CSV, and `dedupe_leads(leads)`
+which drops nameless leads and exact name+address repeats within a single
+scrape run (used by both the CLI and the Streamlit app).
 """
 import re
 import pandas as pd
@@ -32,6 +34,20 @@ def is_duplicate(lead: dict, existing_df: pd.DataFrame, threshold: int = 85) ->
     return False
 
 
+def dedupe_leads(leads: list) -> list:
+    seen = set()
+    out = []
+    for r in leads:
+        key = (r.get('name', '').strip().lower(), r.get('address', '').strip().lower())
+        if not key[0]:
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(r)
+    return out
+
+
 def filter_new_leads(leads: list, existing_path: str, threshold: int = 85) -> pd.DataFrame:
     existing = load_existing(existing_path)
     new = []
@@ -0,0 +1,460 @@
+"""Synthetic lead datasets for benchmarking the comparator at scale.
+
+Extends the demo generator with Persian and Latin names (category, given and
+family name, optional branch), address variants, phones and Google-style
+links. `write_datasets` streams an existing CSV and a
+new-leads CSV to disk; a controlled share of the new rows are perturbed copies
+of existing rows (typos, transliterations, reformatted addresses) and a
+`duplicate_of` column records which existing row each one came from.
+"""
+import csv
+import random
+from typing import Iterator, Optional
+from urllib.parse import quote_plus
+
+from src.demo import SAMPLE_NAMES, SOURCES
+
+
+CATEGORIES = {
+    "Cafe": "کافه",
+    "Restaurant": "رستوران",
+    "Ice Cream": "بستنی",
+    "Bistro": "بیسترو",
+    "Coffee House": "قهوه خانه",
+    "Pizza": "پیتزا",
+    "Kabab": "کباب",
+}
+
+BASE_NAMES = {
+    "Roya": "رویا",
+    "Negin": "نگین",
+    "Ziba": "زیبا",
+    "Laleh": "لاله",
+    "Minoo": "مینو",
+    "Saffron": "زعفران",
+    "Rose": "رز",
+    "Shirin": "شیرین",
+    "Bahar": "بهار",
+    "Setareh": "ستاره",
+    "Mahtab": "مهتاب",
+    "Baran": "باران",
+    "Niloufar": "نیلوفر",
+    "Pardis": "پردیس",
+    "Yas": "یاس",
+    "Arghavan": "ارغوان",
+    "Khorshid": "خورشید",
+    "Sahar": "سحر",
+    "Golnar": "گلنار",
+    "Parvaneh": "پروانه",
+    "Sepideh": "سپیده",
+    "Dena": "دنا",
+    "Alborz": "البرز",
+    "Damavand": "دماوند",
+    "Shemiran": "شمیران",
+    "Naranj": "نارنج",
+    "Anar": "انار",
+    "Pesteh": "پسته",
+    "Toranj": "ترنج",
+    "Tehroon": "تهرون",
+}
+
+FAMILY_NAMES = {
+    "Ahmadi": "احمدی",
+    "Karimi": "کریمی",
+    "Hosseini": "حسینی",
+    "Rezaei": "رضایی",
+    "Mohammadi": "محمدی",
+    "Moradi": "مرادی",
+    "Jafari": "جعفری",
+    "Rahimi": "رحیمی",
+    "Sadeghi": "صادقی",
+    "Kazemi": "کاظمی",
+    "Ghasemi": "قاسمی",
+    "Heidari": "حیدری",
+    "Sharifi": "شریفی",
+    "Akbari": "اکبری",
+    "Nazari": "نظری",
+    "Mousavi": "موسوی",
+    "Rostami": "رستمی",
+    "Bagheri": "باقری",
+    "Ebrahimi": "ابراهیمی",
+    "Hashemi": "هاشمی",
+    "Salehi": "صالحی",
+    "Tehrani": "تهرانی",
+    "Shirazi": "شیرازی",
+    "Esfahani": "اصفهانی",
+    "Tabrizi": "تبریزی",
+    "Kermani": "کرمانی",
+    "Yazdani": "یزدانی",
+    "Farahani": "فراهانی",
+    "Naderi": "نادری",
+    "Amini": "امینی",
+    "Soltani": "سلطانی",
+    "Zamani": "زمانی",
+    "Asadi": "اسدی",
+    "Ansari": "انصاری",
+    "Babaei": "بابایی",
+    "Daneshvar": "دانشور",
+    "Golzar": "گلزار",
+    "Hamidi": "حمیدی",
+    "Jalali": "جلالی",
+    "Khosravi": "خسروی",
+    "Latifi": "لطیفی",
+    "Mansouri": "منصوری",
+    "Niknam": "نیکنام",
+    "Pakzad": "پاکزاد",
+    "Rashidi": "رشیدی",
+    "Sabeti": "ثابتی",
+    "Taheri": "طاهری",
+    "Vahidi": "وحیدی",
+    "Zand": "زند",
+    "Abbasi": "عباسی",
+}
+
+# branch tokens, e.g. "Cafe Roya Karimi (Vanak Branch)"
+NEIGHBOURHOODS = {
+    "Tajrish": "تجریش",
+    "Zafaraniyeh": "زعفرانیه",
+    "Elahiyeh": "الهیه",
+    "Pasdaran": "پاسداران",
+    "Yousefabad": "یوسف آباد",
+    "Gisha": "گیشا",
+    "Sadeghiyeh": "صادقیه",
+    "Punak": "پونک",
+    "Ekbatan": "اکباتان",
+    "Narmak": "نارمک",
+    "Tehranpars": "تهرانپارس",
+    "Vanak": "ونک",
+    "Shahrak Gharb": "شهرک غرب",
+    "Amirabad": "امیرآباد",
+    "Darrous": "دروس",
+    "Farmanieh": "فرمانیه",
+    "Velenjak": "ولنجک",
+    "Nazi Abad": "نازی آباد",
+    "Marzdaran": "مرزداران",
+    "Abbas Abad": "عباس آباد",
+}
+
+# the demo generator's streets come first, then more of the city
+STREETS = {
+    "Valiasr St": "خیابان ولیعصر",
+    "Enghelab Sq": "میدان انقلاب",
+    "Shariati Ave": "خیابان شریعتی",
+    "Niavaran": "نیاوران",
+    "Tajrish Bazaar": "بازار تجریش",
+    "Beheshti St": "خیابان بهشتی",
+    "Saadat Abad": "سعادت آباد",
+    "Jordan St": "خیابان جردن",
+    "Mirdamad Blvd": "بلوار میرداماد",
+    "Keshavarz Blvd": "بلوار کشاورز",
+    "Motahari St": "خیابان مطهری",
+    "Taleghani St": "خیابان طالقانی",
+    "Azadi St": "خیابان آزادی",
+    "Karimkhan St": "خیابان کریمخان",
+    "Vozara St": "خیابان وزرا",
+    "Gandhi St": "خیابان گاندی",
+    "Fatemi Sq": "میدان فاطمی",
+    "Hafez St": "خیابان حافظ",
+    "Ferdowsi Sq": "میدان فردوسی",
+    "Sohrevardi St": "خیابان سهروردی",
+    "Dolat St": "خیابان دولت",
+    "Pirouzi St": "خیابان پیروزی",
+    "Damavand St": "خیابان دماوند",
+    "Sattarkhan St": "خیابان ستارخان",
+    "Kashani Blvd": "بلوار کاشانی",
+    "Ferdows Blvd": "بلوار فردوس",
+    "Farahzadi Blvd": "بلوار فرحزادی",
+    "Iran Zamin St": "خیابان ایران زمین",
+    "Zartosht St": "خیابان زرتشت",
+    "Sheikh Bahaei St": "خیابان شیخ بهایی",
+    "Andarzgou Blvd": "بلوار اندرزگو",
+    "Bahar St": "خیابان بهار",
+    "Resalat Sq": "میدان رسالت",
+    "Hengam St": "خیابان هنگام",
+    "Kargar St": "خیابان کارگر",
+    "Navab Hwy": "بزرگراه نواب",
+    "Jomhouri St": "خیابان جمهوری",
+    "Lalehzar St": "خیابان لاله زار",
+    "Nobonyad Sq": "میدان نوبنیاد",
+    "Ostad Nejatollahi St": "خیابان استاد نجات اللهی",
+}
+STREET_NAMES = list(STREETS)
+
+CITIES = {"Tehran": "تهران"}
+
+# alternative Latin spellings seen across sources
+SPELLINGS = {
+    "Cafe": ["Café", "Kafe", "Caffe"],
+    "Coffee House": ["Coffeehouse", "Coffee Shop"],
+    "Kabab": ["Kebab", "Kabob"],
+    "Niloufar": ["Nilufar", "Niloofar"],
+    "Minoo": ["Minu", "Mino"],
+    "Laleh": ["Lale"],
+    "Setareh": ["Setare"],
+    "Tehroon": ["Tehrun"],
+    "Valiasr": ["Vali Asr", "Vali-e Asr"],
+    "Shariati": ["Shariaty"],
+    "Hosseini": ["Hoseini", "Husseini"],
+    "Mousavi": ["Musavi"],
+    "Rezaei": ["Rezaie", "Rezai"],
+    "Ghasemi": ["Qasemi"],
+    "Sadeghi": ["Sadeqi"],
+    "Babaei": ["Babaie"],
+    "Yousefabad": ["Yusefabad"],
+    "Karimkhan": ["Karim Khan"],
+    "Saadat Abad": ["Saadatabad"],
+    "St": ["Street", "St."],
+    "Ave": ["Avenue", "Ave."],
+    "Blvd": ["Boulevard", "Blvd."],
+    "Sq": ["Square"],
+    "Branch": ["Br.", "branch"],
+}
+
+FA_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+FIELDS = ["name", "address", "source", "link", "phone"]
+NEW_FIELDS = FIELDS + ["duplicate_of", "run_repeat"]
+
+
+def _entity(i: int, seed: int) -> dict:
+    """Canonical attributes of business `i`; the same (i, seed) always match."""
+    rng = random.Random(seed * 1_000_003 + i)
+    sample = None
+    if rng.random() < 0.02:
+        sample = rng.choice(SAMPLE_NAMES)
+    branch = None
+    if sample or rng.random() < 0.3:
+        branch = rng.choice(list(NEIGHBOURHOODS))
+    return {
+        "sample": sample,
+        "category": rng.choice(list(CATEGORIES)),
+        "base": rng.choice(list(BASE_NAMES)),
+        "family": rng.choice(list(FAMILY_NAMES)),
+        "template": rng.randrange(3),
+        "branch": branch,
+        "persian": sample is None and rng.random() < 0.3,
+        "street": rng.choice(STREET_NAMES),
+        "number": rng.randint(1, 2000),
+        "alley": rng.randint(1, 30) if rng.random() < 0.5 else 0,
+        "mobile": rng.random() < 0.6,
+        "phone": rng.randint(10_000_000, 99_999_999),
+        "source": rng.choice(SOURCES),
+        "cid": rng.getrandbits(64),
+        "lat": 35.6 + rng.random() * 0.2,
+        "lng": 51.3 + rng.random() * 0.2,
+    }
+
+
+def _respell(text: str, rng: random.Random) -> str:
+    for word, variants in SPELLINGS.items():
+        if word in text and rng.random() < 0.5:
+            text = text.replace(word, rng.choice(variants), 1)
+    return text
+
+
+# word orders, e.g. "Cafe Roya Karimi", "Roya Cafe Karimi", "Karimi Roya Cafe"
+NAME_TEMPLATES = [
+    ("category", "base", "family"),
+    ("base", "category", "family"),
+    ("family", "base", "category"),
+]
+
+
+def _name(e: dict, rng: Optional[random.Random] = None) -> str:
+    if e["sample"]:
+        name = f"{e['sample']} ({e['branch']} Branch)"
+    elif e["persian"]:
+        vocab = {"category": CATEGORIES, "base": BASE_NAMES, "family": FAMILY_NAMES}
+        name = " ".join(vocab[k][e[k]] for k in NAME_TEMPLATES[e["template"]])
+        if e["branch"]:
+            name += f" (شعبه {NEIGHBOURHOODS[e['branch']]})"
+    else:
+        name = " ".join(e[k] for k in NAME_TEMPLATES[e["template"]])
+        if e["branch"]:
+            name += f" ({e['branch']} Branch)"
+    if rng is not None and not e["persian"]:
+        name = _respell(name, rng)
+    return name
+
+
+def _address(e: dict, location: str, rng: Optional[random.Random] = None) -> str:
+    city = location or "Tehran"
+    if e["persian"]:
+        parts = [CITIES.get(city, city), STREETS[e["street"]]]
+        if e["alley"]:
+            parts.append("کوچه " + str(e["alley"]).translate(FA_DIGITS))
+        parts.append("پلاک " + str(e["number"]).translate(FA_DIGITS))
+        return "، ".join(parts)
+    number = f"No. {e['number']}"
+    if rng is not None:
+        number = rng.choice([number, f"#{e['number']}", f"No {e['number']}", f"Plaque {e['number']}"])
+    parts = [number]
+    if e["alley"]:
+        parts.append(f"Alley {e['alley']}")
+    parts.append(_respell(e["street"], rng) if rng is not None else e["street"])
+    if rng is None or rng.random() < 0.8:
+        parts.append(city)
+    return ", ".join(parts)
+
+
+def _phone(e: dict, rng: Optional[random.Random] = None) -> str:
+    digits = str(e["phone"])
+    if e["mobile"]:
+        op = 10 + e["phone"] % 90
+        local = f"9{op} {digits[:3]} {digits[3:7]}"
+    else:
+        local = f"21 {digits[:4]} {digits[4:]}"
+    if rng is None:
+        return f"+98 {local}"
+    compact = local.replace(" ", "")
+    return rng.choice([f"+98 {local}", f"0{local}", f"0{compact}", f"0{compact}".translate(FA_DIGITS)])
+
+
+def _link(e: dict, name: str, source: str) -> str:
+    cid = e["cid"]
+    if source == "snappfood":
+        return f"https://snappfood.ir/restaurant/menu/{quote_plus(name)}-r-{cid % 0xFFFFFF:06x}/"
+    if source == "instagram":
+        return f"https://www.instagram.com/{quote_plus(name.replace(' ', '_').lower())}{cid % 1000}/"
+    return (
+        f"https://www.google.com/maps/place/{quote_plus(name)}/data=!4m7!3m6"
+        f"!1s0x3f8e{cid >> 16:012x}:0x{cid:016x}!8m2!3d{e['lat']:.7f}!4d{e['lng']:.7f}"
+    )
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    if len(text) < 4:
+        return text
+    i = rng.randrange(1, len(text) - 1)
+    op = rng.randrange(4)
+    if op == 0:
+        return text[:i] + text[i + 1:]
+    if op == 1:
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if op == 2:
+        return text[:i] + text[i] + text[i:]
+    return text[:i] + rng.choice("aeiouyhnr") + text[i + 1:]
+
+
+def _lead(e: dict, location: str) -> dict:
+    name = _name(e)
+    return {
+        "name": name,
+        "address": _address(e, location),
+        "source": e["source"],
+        "link": _link(e, name, e["source"]),
+        "phone": _phone(e),
+    }
+
+
+def _perturbed_lead(e: dict, location: str, rng: random.Random) -> dict:
+    """A re-scrape of `e`: another source, transliterated or misspelled."""
+    e = dict(e)
+    if e["sample"] is None and rng.random() < 0.2:
+        e["persian"] = not e["persian"]
+    source = rng.choice(SOURCES)
+    name = _name(e, rng)
+    if rng.random() < 0.5:
+        name = _typo(name, rng)
+    if rng.random() < 0.2:
+        name = name.upper() if rng.random() < 0.5 else name.lower()
+    address = _address(e, location, rng)
+    if rng.random() < 0.2:
+        address = _typo(address, rng)
+    return {
+        "name": name,
+        "address": address,
+        "source": source,
+        "link": _link(e, name, source),
+        "phone": _phone(e, rng),
+    }
+
+
+def _repeated_lead(row: dict, e: dict, rng: random.Random) -> dict:
+    """`row` found again in the same run, e.g. under another category or source."""
+    row = dict(row)
+    source = rng.choice(SOURCES)
+    if source != row["source"]:
+        row["source"] = source
+        row["link"] = _link(e, row["name"], source)
+    roll = rng.random()
+    if roll < 0.3:
+        row["name"] = rng.choice([row["name"].upper(), row["name"].lower(), row["name"].title()])
+    elif roll < 0.5:
+        row["name"] = f" {row['name']} "
+    elif roll < 0.6:
+        # variants the exact-key dedupe cannot catch
+        row["name"] = row["name"].replace(" ", "  ", 1)
+    elif roll < 0.7:
+        row["address"] = row["address"].rsplit(",", 1)[0]
+    row["run_repeat"] = "1"
+    return row
+
+
+def synthetic_leads(count: int, location: str = "", seed: int = 42, start: int = 0) -> Iterator[dict]:
+    """Yield canonical leads for businesses `start` .. `start + count - 1`."""
+    for i in range(start, start + count):
+        yield _lead(_entity(i, seed), location)
+
+
+def synthetic_scrape(
+    count: int,
+    existing_count: int,
+    dup_rate: float = 0.2,
+    repeat_rate: float = 0.05,
+    location: str = "",
+    seed: int = 42,
+) -> Iterator[dict]:
+    """Yield scraped leads; about `dup_rate` of them re-find existing rows.
+
+    Another `repeat_rate` re-find a recent lead from the same run (as when
+    one place shows up under several categories or sources) with case,
+    whitespace or address-suffix changes, flagged with `run_repeat`.
+    `duplicate_of` holds the existing row index or ''.
+    """
+    rng = random.Random(seed)
+    recent = []
+    fresh = existing_count
+    for _ in range(count):
+        roll = rng.random()
+        if recent and roll < repeat_rate:
+            row, e = rng.choice(recent)
+            yield _repeated_lead(row, e, rng)
+            continue
+        if existing_count and roll < repeat_rate + dup_rate:
+            j = rng.randrange(existing_count)
+            e = _entity(j, seed)
+            row = _perturbed_lead(e, location, rng)
+            row["duplicate_of"] = str(j)
+        else:
+            e = _entity(fresh, seed)
+            row = _lead(e, location)
+            row["duplicate_of"] = ""
+            fresh += 1
+        row["run_repeat"] = ""
+        if len(recent) < 1000:
+            recent.append((row, e))
+        else:
+            recent[rng.randrange(1000)] = (row, e)
+        yield row
+
+
+def write_datasets(
+    existing_path: str,
+    new_path: str,
+    existing_count: int,
+    new_count: int,
+    dup_rate: float = 0.2,
+    repeat_rate: float = 0.05,
+    location: str = "",
+    seed: int = 42,
+) -> None:
+    """Stream an existing CSV and a scraped-leads CSV to disk."""
+    with open(existing_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=FIELDS)
+        w.writeheader()
+        w.writerows(synthetic_leads(existing_count, location, seed))
+    with open(new_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=NEW_FIELDS)
+        w.writeheader()
+        w.writerows(synthetic_scrape(new_count, existing_count, dup_rate, repeat_rate, location, seed))
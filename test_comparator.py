@@ -0,0 +1,13 @@
+from src.comparator import dedupe_leads
+
+
+def test_dedupe_keeps_first_occurrence():
+    leads = [
+        {'name': 'Cafe Roya', 'address': 'Valiasr St', 'source': 'google_maps'},
+        {'name': ' CAFE ROYA ', 'address': 'valiasr st', 'source': 'snappfood'},
+        {'name': '', 'address': 'Jordan St', 'source': 'instagram'},
+        {'name': 'Cafe Negin', 'address': 'Valiasr St', 'source': 'snappfood'},
+    ]
+    out = dedupe_leads(leads)
+    assert [r['source'] for r in out] == ['google_maps', 'snappfood']
+    assert out[0] is leads[0]
@@ -0,0 +1,35 @@
+import sys
+
+import pandas as pd
+import pytest
+
+import run_scrape
+from run_scrape import load_replay, process_leads
+
+
+def test_replay_round_trip(tmp_path):
+    existing_path, recorded_path = tmp_path / 'existing.csv', tmp_path / 'recorded.csv'
+    pd.DataFrame([{'name': 'Cafe Roya', 'address': 'No. 12, Valiasr St, Tehran'}]).to_csv(existing_path, index=False)
+    recorded = [
+        {'name': 'Cafe Roya', 'address': 'No. 12, Valiasr St, Tehran', 'source': 'google_maps'},
+        {'name': 'Kabab Sahar Karimi', 'address': 'No. 7, Jordan St, Tehran', 'source': 'snappfood'},
+        {'name': 'Kabab Sahar Karimi', 'address': 'No. 7, Jordan St, Tehran', 'source': 'google_maps'},
+    ]
+    pd.DataFrame(recorded).to_csv(recorded_path, index=False)
+    assert load_replay(recorded_path) == recorded
+    new_df = process_leads(load_replay(recorded_path), existing_path)
+    assert new_df.to_dict('records') == [recorded[1]]
+
+
+def test_replay_of_empty_recording(tmp_path):
+    recorded_path = tmp_path / 'recorded.csv'
+    pd.DataFrame([]).to_csv(recorded_path, index=False)
+    assert load_replay(recorded_path) == []
+
+
+def test_record_and_replay_are_exclusive(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['run_scrape.py', '--existing', 'e.csv', '--record', 'a.csv', '--replay', 'b.csv'])
+    with pytest.raises(SystemExit) as exc:
+        run_scrape.main()
+    assert exc.value.code == 2
+    assert 'not allowed with argument' in capsys.readouterr().err
@@ -0,0 +1,28 @@
+import pandas as pd
+
+from src.synthetic import synthetic_leads, synthetic_scrape, write_datasets
+
+
+def test_same_seed_same_data():
+    assert list(synthetic_scrape(500, 1000, seed=7)) == list(synthetic_scrape(500, 1000, seed=7))
+    assert list(synthetic_leads(50, seed=7)) != list(synthetic_leads(50, seed=8))
+
+
+def test_dup_and_repeat_shares():
+    rows = list(synthetic_scrape(20000, 5000, dup_rate=0.2, repeat_rate=0.05))
+    repeats = sum(1 for r in rows if r['run_repeat'])
+    dups = sum(1 for r in rows if r['duplicate_of'] and not r['run_repeat'])
+    assert abs(repeats / len(rows) - 0.05) < 0.01
+    assert abs(dups / len(rows) - 0.2) < 0.02
+
+
+def test_duplicate_of_points_at_existing_row(tmp_path):
+    existing_path, new_path = tmp_path / 'existing.csv', tmp_path / 'new.csv'
+    write_datasets(existing_path, new_path, 300, 200, dup_rate=0.5)
+    existing = pd.read_csv(existing_path, dtype=str, keep_default_na=False)
+    new = pd.read_csv(new_path, dtype=str, keep_default_na=False)
+    dups = new[new['duplicate_of'] != '']
+    assert len(dups) > 0
+    for j in dups['duplicate_of'].astype(int):
+        assert 0 <= j < len(existing)
+        assert existing.iloc[j]['name']